@@ -0,0 +1,266 @@
+"""Cache layer for the PCSO Lotto Results API.
+
+Two tiers:
+    * L1: small in-process TTL/LRU cache (``cachetools``) for hot keys.
+    * L2: Upstash Redis if configured; otherwise an in-memory fallback.
+
+All keys follow ``{domain}:{identifier}:{sub-identifier}`` and are built by
+the ``*_cache_key`` helpers below, so every caller shares the same schema and
+related keys can be dropped together with ``invalidate_prefix``.
+
+Environment variables (optional):
+    UPSTASH_REDIS_REST_URL      Redis REST endpoint (for caching)
+    UPSTASH_REDIS_REST_TOKEN    Redis auth token
+"""
+
+import os
+import time
+from datetime import date
+from fnmatch import fnmatchcase
+from typing import Optional, Any
+
+from cachetools import TLRUCache
+from dotenv import load_dotenv
+from upstash_redis.asyncio import Redis
+
+# Load environment variables from .env if present
+load_dotenv()
+
+# Caching TTLs
+EVENT_TTL = 3600       # seconds for hidden ASP.NET fields (evicted early if a POST fails)
+RESULT_TTL = 60        # seconds for full query results
+LAST_GOOD_TTL = 86400  # seconds to keep a stale copy for serving on upstream errors
+REFRESH_AHEAD_SEC = 10 # re-scrape in the background once a hit is this close to expiry
+
+
+# --------------------
+# Keys
+# --------------------
+KEY_DOMAIN = "pcso"
+RESULTS_PATTERN = f"{KEY_DOMAIN}:results:*"
+
+
+def make_key(*parts: Any) -> str:
+    """Join key parts under the cache domain: ``pcso:<part>:<part>...``."""
+    return ":".join((KEY_DOMAIN, *map(str, parts)))
+
+
+def make_result_cache_key(start_dt: date, end_dt: date) -> str:
+    """Cache key for results (game fixed to '0'=All for now)."""
+    return make_key("results", start_dt.isoformat(), end_dt.isoformat(), "game0")
+
+
+def make_page_cache_key(rkey: str, page: int, per_page: int) -> str:
+    """Cache key for a single page view of a result set."""
+    return f"{rkey}:p{page}:n{per_page}"
+
+
+def make_last_good_cache_key(rkey: str) -> str:
+    """Long-lived stale copy of a result set: ``pcso:last_good:results:...``.
+
+    Lives outside ``RESULTS_PATTERN`` so schema-change invalidation keeps it.
+    """
+    return make_key("last_good", rkey.partition(":")[2])
+
+
+def make_rows_list_key(rkey: str) -> str:
+    """Redis list of JSON rows for a result set, read a page at a time via LRANGE.
+
+    Shared by the fresh and last-good entries, so it sits under the last-good
+    key and lives for LAST_GOOD_TTL; the short-lived ``rkey`` entry decides
+    whether it is still fresh.
+    """
+    return f"{make_last_good_cache_key(rkey)}:rows"
+
+
+def event_cache_key() -> str:
+    """Cache key for hidden ASP.NET form fields (VIEWSTATE etc.)."""
+    return make_key("event_fields")
+
+
+# --------------------
+# L2 (Redis or in-memory fallback)
+# --------------------
+class InMemoryAsyncCache:
+    """Minimal async dict + TTL (subset of Redis commands used here).
+
+    For dev / single process fallback only. No lock is needed: each method
+    runs without awaiting, so dict access is never interleaved on the loop.
+    """
+
+    def __init__(self):
+        self._store: dict[str, tuple[Optional[float], Any]] = {}
+
+    async def get(self, key: str):  # type: ignore[override]
+        item = self._store.get(key)
+        if not item:
+            return None
+        expires_at, value = item
+        if expires_at is not None and expires_at < time.time():
+            # Expired - remove and miss (pop tolerates a concurrent removal)
+            self._store.pop(key, None)
+            return None
+        return value
+
+    async def set(self, key: str, value: Any, ex: Optional[int] = None, **_):  # type: ignore[override]
+        expires_at = (time.time() + ex) if ex else None
+        self._store[key] = (expires_at, value)
+        return True
+
+    async def rpush(self, key: str, *values: Any) -> int:  # type: ignore[override]
+        current = await self.get(key)
+        items = (current if isinstance(current, list) else []) + list(values)
+        expires_at = self._store[key][0] if current is not None else None
+        self._store[key] = (expires_at, items)
+        return len(items)
+
+    async def lrange(self, key: str, start: int, stop: int) -> list:  # type: ignore[override]
+        items = await self.get(key)
+        if not isinstance(items, list):
+            return []
+        # Redis LRANGE: inclusive stop, -1 meaning "to the end"
+        return items[start:None if stop == -1 else stop + 1]
+
+    async def expire(self, key: str, seconds: int) -> bool:  # type: ignore[override]
+        item = self._store.get(key)
+        if item is None:
+            return False
+        self._store[key] = (time.time() + seconds, item[1])
+        return True
+
+    async def ttl(self, key: str) -> int:  # type: ignore[override]
+        """Remaining seconds; -1 if the key has no expiry, -2 if it is missing."""
+        if await self.get(key) is None:
+            return -2
+        expires_at = self._store[key][0]
+        return -1 if expires_at is None else int(expires_at - time.time())
+
+    async def delete(self, *keys: str) -> int:  # type: ignore[override]
+        return sum(self._store.pop(key, None) is not None for key in keys)
+
+    async def scan(self, cursor: int, match: Optional[str] = None, **_) -> tuple[int, list[str]]:  # type: ignore[override]
+        """Single-pass SCAN: returns every matching key with a 0 cursor."""
+        keys = [k for k in list(self._store) if match is None or fnmatchcase(k, match)]
+        return 0, keys
+
+    def multi(self) -> "_InMemoryTransaction":
+        return _InMemoryTransaction(self)
+
+    pipeline = multi  # already atomic here, so a pipeline is the same thing
+
+
+class _InMemoryTransaction:
+    """MULTI/EXEC (and pipeline) stand-in: queues commands and runs them back to back.
+
+    The queued methods never yield to the loop, so ``exec`` is atomic just
+    like a Redis transaction.
+    """
+
+    def __init__(self, cache: InMemoryAsyncCache):
+        self._cache = cache
+        self._commands: list = []
+
+    def __getattr__(self, name: str):
+        def queue(*args: Any, **kwargs: Any) -> "_InMemoryTransaction":
+            self._commands.append((getattr(self._cache, name), args, kwargs))
+            return self
+        return queue
+
+    async def exec(self) -> list:
+        results = [await command(*args, **kwargs) for command, args, kwargs in self._commands]
+        self._commands = []
+        return results
+
+
+REDIS_URL = os.getenv("UPSTASH_REDIS_REST_URL")
+REDIS_TOKEN = os.getenv("UPSTASH_REDIS_REST_TOKEN")
+
+if REDIS_URL and REDIS_TOKEN:
+    try:
+        redis = Redis(url=REDIS_URL, token=REDIS_TOKEN)
+    except Exception:
+        # Fallback if instantiation fails
+        redis = InMemoryAsyncCache()
+else:
+    # No credentials provided -> in-memory fallback
+    redis = InMemoryAsyncCache()
+
+
+# --------------------
+# L1 + read/write helpers
+# --------------------
+# Entries are stored as (ttl, value) so each key keeps the same TTL it was
+# given in Redis.
+L1_CACHE: TLRUCache = TLRUCache(maxsize=1024, ttu=lambda _key, item, now: now + item[0])
+
+
+async def cache_get(key: str, ttl: int = RESULT_TTL) -> Any:
+    """Read through L1, falling back to Redis.
+
+    A Redis hit populates L1 for ``ttl`` capped at the key's remaining Redis
+    TTL (fetched in the same pipeline), so an L1 copy never outlives its key.
+    """
+    item = L1_CACHE.get(key)
+    if item is not None:
+        return item[1]
+    pipe = redis.pipeline()
+    pipe.get(key)
+    pipe.ttl(key)
+    value, remaining = await pipe.exec()
+    if value:
+        if remaining >= 0:  # -1: key has no expiry
+            ttl = min(ttl, remaining)
+        if ttl > 0:
+            L1_CACHE[key] = (ttl, value)
+    return value
+
+
+async def cache_set(key: str, value: Any, ex: int) -> None:
+    """Write to Redis and L1 with the same TTL."""
+    await redis.set(key, value, ex=ex)
+    L1_CACHE[key] = (ex, value)
+
+
+async def cache_delete(key: str) -> None:
+    """Evict a key from both L1 and Redis."""
+    L1_CACHE.pop(key, None)
+    await redis.delete(key)
+
+
+async def list_set(key: str, values: list[str], ex: int) -> None:
+    """Replace a Redis list with ``values`` and give it a TTL (L2 only).
+
+    Runs as one MULTI/EXEC so readers never see the list missing, partial or
+    without its TTL.
+    """
+    tx = redis.multi()
+    tx.delete(key)
+    if values:
+        tx.rpush(key, *values)
+        tx.expire(key, ex)
+    await tx.exec()
+
+
+async def list_range(key: str, start: int, stop: int) -> list[str]:
+    """LRANGE passthrough (inclusive ``stop``); lists are not held in L1."""
+    return await redis.lrange(key, start, stop)
+
+
+async def invalidate_prefix(pattern: str) -> int:
+    """Evict every key matching a glob ``pattern`` (e.g. ``pcso:results:*``).
+
+    Uses SCAN MATCH + DEL against Redis so the server is never blocked by
+    KEYS. Returns the number of Redis keys deleted.
+    """
+    for key in [k for k in list(L1_CACHE) if fnmatchcase(k, pattern)]:
+        L1_CACHE.pop(key, None)
+
+    deleted = 0
+    cursor = 0
+    while True:
+        cursor, keys = await redis.scan(cursor, match=pattern, count=500)
+        if keys:
+            deleted += await redis.delete(*keys)
+        cursor = int(cursor)
+        if not cursor:
+            return deleted
@@ -5,8 +5,10 @@ and returns normalized structured data with pagination.
 
 Key features:
     * Date range query (defaults constrained to site supported range).
-    * Lightweight caching layer (Redis via Upstash if configured; in-memory fallback).
-    * Fast scraping using curl_cffi (HTTP/2, Chrome impersonation) + selectolax parser.
+    * Lightweight caching layer (see ``cache.py``: in-process L1 + Redis via
+      Upstash if configured; in-memory fallback).
+    * Fast scraping using curl_cffi (HTTP/2, Chrome impersonation) + selectolax
+      (Lexbor backend) parser.
 
 Environment variables (optional):
     UPSTASH_REDIS_REST_URL      Redis REST endpoint (for caching)
@@ -19,23 +21,44 @@ container deployments).
 
 import asyncio
 import calendar
-import json
+import html
+import re
 import time
+from contextlib import asynccontextmanager
+from itertools import groupby
 from math import ceil
 from datetime import date, datetime
-from typing import Optional, Dict, Tuple, Any
+from zoneinfo import ZoneInfo
+from typing import Optional, Dict, Tuple
 
-import pytz
-from fastapi import FastAPI, Query, HTTPException
+import fastapi
+import orjson
+from fastapi import FastAPI, Query, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from selectolax.parser import HTMLParser
+from selectolax.lexbor import LexborHTMLParser as HTMLParser
 from curl_cffi import requests
-from upstash_redis.asyncio import Redis
-from dotenv import load_dotenv
-import os
 
-# Load environment variables from .env if present
-load_dotenv()
+from cache import (
+    EVENT_TTL,
+    LAST_GOOD_TTL,
+    RESULT_TTL,
+    REFRESH_AHEAD_SEC,
+    RESULTS_PATTERN,
+    cache_get,
+    cache_set,
+    event_cache_key,
+    invalidate_prefix,
+    list_range,
+    list_set,
+    make_last_good_cache_key,
+    make_page_cache_key,
+    make_result_cache_key,
+    make_rows_list_key,
+    redis,
+    L1_CACHE,
+)
+
 # --------------------
 # Constants & config
 # --------------------
@@ -50,65 +73,59 @@ HEADERS = {
 }
 
 MIN_START_DATE = date(2015, 1, 1)
-MAX_END_DATE = datetime.now(pytz.timezone("Asia/Manila")).date()
+MANILA_TZ = ZoneInfo("Asia/Manila")
+
+# Parsing constants (built once at import, not per request)
+EVENT_FIELD_NAMES = frozenset({"__VIEWSTATE", "__VIEWSTATEGENERATOR", "__EVENTVALIDATION"})
+# ASP.NET renders hidden fields in a stable form:
+#   <input type="hidden" name="__VIEWSTATE" id="__VIEWSTATE" value="..." />
+HIDDEN_FIELD_RE = re.compile(rb'<input[^>]*?\bname="(__[A-Z]+)"[^>]*?\bvalue="([^"]*)"')
+# ASP.NET error page text shown when posted VIEWSTATE/EVENTVALIDATION is stale
+STALE_FIELDS_MARKERS = (
+    b"Validation of viewstate MAC failed",
+    b"The state information is invalid for this page",
+    b"Invalid postback or callback argument",
+)
+RESULT_TABLE_SELECTOR = "table.search-lotto-result-table"
+EXPECTED_HEADERS = ["LOTTO GAME", "COMBINATIONS", "DRAW DATE", "JACKPOT (PHP)", "WINNERS"]
+RESULT_FIELDS = ("game", "combination", "draw_date", "jackpot_php", "winners")
 
 # Month lookup optimization
 MONTH_MAP = {m: i for i, m in enumerate(calendar.month_name) if m}
 
-# --------------------
-# Cache (Redis or in-memory fallback)
-# --------------------
-class InMemoryAsyncCache:
-    """Minimal async dict + TTL (subset of Redis get/set used here).
+# Limit concurrent outbound requests to PCSO
+OUTBOUND_SEMAPHORE = asyncio.Semaphore(8)
 
-    For dev / single process fallback only.
-    """
+# Single refresher for the (single-key) hidden event fields
+EVENT_FIELDS_LOCK = asyncio.Lock()
 
-    def __init__(self):
-        self._store: dict[str, tuple[Optional[float], Any]] = {}
-        self._lock = asyncio.Lock()
-
-    async def get(self, key: str):  # type: ignore[override]
-        now = time.time()
-        async with self._lock:
-            item = self._store.get(key)
-            if not item:
-                return None
-            expires_at, value = item
-            if expires_at is not None and expires_at < now:
-                # Expired - remove and miss
-                self._store.pop(key, None)
-                return None
-            return value
-
-    async def set(self, key: str, value: Any, ex: Optional[int] = None, **_):  # type: ignore[override]
-        expires_at = (time.time() + ex) if ex else None
-        async with self._lock:
-            self._store[key] = (expires_at, value)
-        return True
+# In-flight scrapes keyed by result cache key (stampede protection)
+_inflight: dict[str, asyncio.Task] = {}
 
+# FastAPI >= 0.130 serializes response models straight to JSON bytes via
+# Pydantic, but only with the default response class (ORJSONResponse is
+# deprecated from 0.131). Older versions go through json.dumps, so use orjson.
+FASTAPI_DUMPS_JSON = tuple(int(p) for p in fastapi.__version__.split(".")[:2]) >= (0, 130)
 
-REDIS_URL = os.getenv("UPSTASH_REDIS_REST_URL")
-REDIS_TOKEN = os.getenv("UPSTASH_REDIS_REST_TOKEN")
 
-if REDIS_URL and REDIS_TOKEN:
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Share one outbound HTTP session (connection pool, TLS, HTTP/2) app-wide."""
+    app.state.session = requests.AsyncSession(
+        impersonate="chrome136", verify=False, http_version="v2",
+    )
     try:
-        redis = Redis(url=REDIS_URL, token=REDIS_TOKEN)
-    except Exception:
-        # Fallback if instantiation fails
-        redis = InMemoryAsyncCache()
-else:
-    # No credentials provided -> in-memory fallback
-    redis = InMemoryAsyncCache()
+        yield
+    finally:
+        await app.state.session.close()
 
-# Caching TTLs
-EVENT_TTL = 30         # seconds for hidden ASP.NET fields
-RESULT_TTL = 60        # seconds for full query results
-
-# Limit concurrent outbound requests to PCSO
-OUTBOUND_SEMAPHORE = asyncio.Semaphore(8)
 
-app = FastAPI(title="PCSO Lotto Results Unofficial API", version="2.0.0")
+app = FastAPI(
+    title="PCSO Lotto Results Unofficial API",
+    version="2.0.0",
+    lifespan=lifespan,
+    **({} if FASTAPI_DUMPS_JSON else {"default_response_class": ORJSONResponse}),
+)
 
 
 # --------------------
@@ -147,6 +164,11 @@ def format_human_date(d: date) -> str:
     """Return human readable date form: 'Month D, YYYY'."""
     return f"{d.strftime('%B')} {d.day}, {d.year}" 
 
+def max_end_date() -> date:
+    """Latest queryable date: today in Asia/Manila (evaluated per call)."""
+    return datetime.now(MANILA_TZ).date()
+
+
 def validate_and_resolve_dates(
     start_month: Optional[str],
     start_day: Optional[int],
@@ -159,24 +181,28 @@ def validate_and_resolve_dates(
 
     Returns tuple: (start_dt, end_dt, start_month, start_day, start_year, end_month, end_day, end_year)
     """
+    max_end = max_end_date()
+
     # Apply defaults
     if start_month is None or start_day is None or start_year is None:
         start_month = MIN_START_DATE.strftime("%B")
         start_day = MIN_START_DATE.day
         start_year = MIN_START_DATE.year
     if end_month is None or end_day is None or end_year is None:
-        end_month = MAX_END_DATE.strftime("%B")
-        end_day = MAX_END_DATE.day
-        end_year = MAX_END_DATE.year
-
-    # Month validation
-    if start_month not in MONTH_MAP or end_month not in MONTH_MAP:
+        end_month = max_end.strftime("%B")
+        end_day = max_end.day
+        end_year = max_end.year
+
+    # Month validation (single lookup each; 0 = unknown month)
+    start_month_num = MONTH_MAP.get(start_month, 0)
+    end_month_num = MONTH_MAP.get(end_month, 0)
+    if not start_month_num or not end_month_num:
         raise HTTPException(status_code=400, detail="Invalid month name provided.")
 
     # Date object validation
     try:
-        start_dt = date(start_year, MONTH_MAP[start_month], start_day)
-        end_dt = date(end_year, MONTH_MAP[end_month], end_day)
+        start_dt = date(start_year, start_month_num, start_day)
+        end_dt = date(end_year, end_month_num, end_day)
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid day for the given month/year.")
 
@@ -186,10 +212,10 @@ def validate_and_resolve_dates(
             status_code=400,
             detail=f"Start date cannot be earlier than {format_human_date(MIN_START_DATE)}."
         )
-    if end_dt > MAX_END_DATE:
+    if end_dt > max_end:
         raise HTTPException(
             status_code=400,
-            detail=f"End date cannot be later than {format_human_date(MAX_END_DATE)} (today in Manila)."
+            detail=f"End date cannot be later than {format_human_date(max_end)} (today in Manila)."
         )
     if end_dt < start_dt:
         raise HTTPException(status_code=400, detail="End date cannot be earlier than start date.")
@@ -201,83 +227,309 @@ def validate_and_resolve_dates(
     )
 
 
-def make_result_cache_key(start_dt: date, end_dt: date) -> str:
-    """Cache key for results (game fixed to '0'=All for now)."""
-    return f"pcso:results:{start_dt.isoformat()}:{end_dt.isoformat()}:game0"
-
-
-def event_cache_key() -> str:
-    """Cache key for hidden ASP.NET form fields (VIEWSTATE etc.)."""
-    return "pcso:event_fields"
-
-
 # --------------------
 # Scraper (async)
 # --------------------
-async def get_event_fields_async(session: requests.AsyncSession) -> Dict[str, str]:
-    """Fetch & cache hidden form fields needed for POST searches.
-
-    Fields change periodically; short TTL (EVENT_TTL) keeps them fresh while
-    avoiding an extra GET for each query.
-    """
-    # Cache first
-    cache = await redis.get(event_cache_key())
+async def get_cached_event_fields() -> Optional[Dict[str, str]]:
+    """Return cached hidden form fields, or None on miss/corruption."""
+    cache = await cache_get(event_cache_key(), ttl=EVENT_TTL)
     if cache:
         try:
-            fields = json.loads(cache)
+            fields = orjson.loads(cache)
             if isinstance(fields, dict) and fields:
                 return fields
         except Exception:
             pass  # fall through to refresh
+    return None
 
-    async with OUTBOUND_SEMAPHORE:
-        r = await session.get(BASE_URL, headers=HEADERS)
-    r.raise_for_status()
-    tree = HTMLParser(r.text)
 
-    fields: Dict[str, str] = {}
-    for name in ["__VIEWSTATE", "__VIEWSTATEGENERATOR", "__EVENTVALIDATION"]:
-        node = tree.css_first(f'input[name="{name}"]')
-        if node:
-            fields[name] = node.attributes.get("value", "")
+async def get_event_fields_async(session: requests.AsyncSession) -> Dict[str, str]:
+    """Fetch & cache hidden form fields needed for POST searches.
+
+    Fields only change when the site is redeployed, so they are cached for a
+    long TTL (EVENT_TTL) and evicted by the scraper when a POST using them
+    fails, avoiding an extra GET for each query. Refreshes are serialized by
+    EVENT_FIELDS_LOCK so a burst of misses triggers a single GET.
+    """
+    # Cache first
+    fields = await get_cached_event_fields()
+    if fields:
+        return fields
+
+    async with EVENT_FIELDS_LOCK:
+        # Another coroutine may have refreshed while we waited
+        fields = await get_cached_event_fields()
+        if fields:
+            return fields
 
-    if not fields:
-        raise ValueError("Failed to extract hidden event fields.")
+        async with OUTBOUND_SEMAPHORE:
+            r = await session.get(BASE_URL, headers=HEADERS)
+        r.raise_for_status()
 
-    # Cache in Redis
-    await redis.set(event_cache_key(), json.dumps(fields), ex=EVENT_TTL)
+        # Regex over the raw body; no need to build a DOM for three attributes
+        fields = {}
+        for name, value in HIDDEN_FIELD_RE.findall(r.content):
+            name = name.decode()
+            if name in EVENT_FIELD_NAMES:
+                fields[name] = html.unescape(value.decode())
+
+        if not fields:
+            raise ValueError("Failed to extract hidden event fields.")
+
+        # Cache in Redis
+        await cache_set(event_cache_key(), orjson.dumps(fields).decode(), ex=EVENT_TTL)
     return fields
 
 
+async def evict_event_fields(rejected: Dict[str, str]) -> None:
+    """Evict cached hidden fields, but only if they are the ones a POST rejected.
+
+    Compare-and-delete runs under EVENT_FIELDS_LOCK against Redis, so a late
+    rejection cannot evict fields another task (or instance) just refreshed.
+    """
+    key = event_cache_key()
+    async with EVENT_FIELDS_LOCK:
+        L1_CACHE.pop(key, None)  # this instance's copy is suspect either way
+        cached = await redis.get(key)
+        if cached and orjson.loads(cached) == rejected:
+            await redis.delete(key)
+
+
+def dump_rows_payload(
+    rows: Optional[list[dict[str, str]]], total_rows: int,
+    expires_at: Optional[float] = None,
+) -> str:
+    """Serialize rows for caching, stamped with their expiry (default RESULT_TTL).
+
+    ``rows=None`` writes only the metadata (rows live in a separate list key).
+    """
+    if expires_at is None:
+        expires_at = time.time() + RESULT_TTL
+    payload: dict = {"total_rows": total_rows, "expires_at": expires_at}
+    if rows is not None:
+        payload["rows"] = rows
+    return orjson.dumps(payload).decode()
+
+
+def near_expiry(expires_at: Optional[float]) -> bool:
+    """True if a stamped cache entry is within REFRESH_AHEAD_SEC of expiring."""
+    return expires_at is not None and expires_at - time.time() < REFRESH_AHEAD_SEC
+
+
+async def get_cached_rows(
+    key: str,
+) -> Optional[Tuple[list[dict[str, str]], int, Optional[float]]]:
+    """Load a cached rows payload as (rows, total_rows, expires_at).
+
+    Returns None on miss/corruption; ``expires_at`` is None for entries
+    written without an expiry stamp.
+    """
+    return parse_rows_payload(await cache_get(key))
+
+
+def parse_rows_payload(
+    cached: Optional[str],
+) -> Optional[Tuple[list[dict[str, str]], int, Optional[float]]]:
+    """Decode a payload written by ``dump_rows_payload``; None if absent/corrupt."""
+    if not cached:
+        return None
+    try:
+        payload = orjson.loads(cached)
+        rows = payload.get("rows", [])
+        return rows, payload.get("total_rows", len(rows)), payload.get("expires_at")
+    except Exception:
+        return None  # ignore cache error and treat as miss
+
+
+async def get_cached_window(
+    rkey: str, page: int, per_page: int,
+) -> Optional[Tuple[list[dict[str, str]], int, Optional[float]]]:
+    """Read only the requested page of a cached result set via LRANGE.
+
+    The ``rkey`` entry holds just total_rows/expires_at; the rows themselves
+    are in a Redis list, so a page costs O(per_page) regardless of range size.
+    Returns None on miss (either key absent).
+    """
+    meta = await get_cached_rows(rkey)
+    if meta is None:
+        return None
+    _, total_rows, expires_at = meta
+    page_rows = await get_rows_page(rkey, total_rows, page, per_page)
+    if page_rows is None:
+        return None
+    return page_rows, total_rows, expires_at
+
+
+async def get_rows_page(
+    rkey: str, total_rows: int, page: int, per_page: int,
+) -> Optional[list[dict[str, str]]]:
+    """LRANGE one page from a result set's rows list; None on miss/corruption."""
+    start_idx = (page - 1) * per_page
+    if start_idx >= total_rows:
+        return []
+    try:
+        raw = await list_range(make_rows_list_key(rkey), start_idx, start_idx + per_page - 1)
+        if not raw:
+            return None  # list expired/evicted ahead of its metadata entry
+        return [orjson.loads(r) for r in raw]
+    except Exception:
+        return None  # ignore cache error and treat as miss
+
+
+async def get_stale_results(
+    rkey: str, page: int, per_page: int,
+) -> Optional[Tuple[list[LottoResult], int]]:
+    """Requested page from the last good copy of a result set, if any.
+
+    The last-good entry holds just total_rows and outlives ``rkey``; the page
+    is read from the shared rows list, like ``get_cached_window``. Only needed
+    on upstream failure, so it is read from Redis directly, never via L1.
+    """
+    try:
+        meta = parse_rows_payload(await redis.get(make_last_good_cache_key(rkey)))
+    except Exception:
+        return None
+    if meta is None:
+        return None
+    _, total_rows, _ = meta
+    page_rows = await get_rows_page(rkey, total_rows, page, per_page)
+    if page_rows is None:
+        return None
+    return [LottoResult.model_construct(**row) for row in page_rows], total_rows
+
+
 async def scrape_lotto_results_async(
+    session: requests.AsyncSession,
     start_month: str, start_day: int, start_year: int,
     end_month: str, end_day: int, end_year: int,
+    page: int = 1, per_page: int = 50,
 ) -> Tuple[list[LottoResult], int]:
-    """Scrape results for inclusive date range, returning (rows, total_rows).
-
-    Uses cache; on miss performs GET (fields) + POST (results). Parses HTML
-    table into structured list. Unexpected structure raises ValueError to signal
-    upstream error handling.
+    """Scrape results for inclusive date range, returning (page_rows, total_rows).
+
+    Uses a per-page cache entry first, then the page's window of the
+    full-range entry; on miss performs GET (fields) + POST (results). Parses
+    HTML table into structured list. Unexpected structure raises ValueError
+    to signal upstream error handling. A page past the end yields an empty
+    list with the real total. Hits within REFRESH_AHEAD_SEC of expiry are
+    served as-is while a background scrape refreshes the entry.
     """
-    # Check result cache
     start_dt = date(start_year, MONTH_MAP[start_month], start_day)
     end_dt = date(end_year, MONTH_MAP[end_month], end_day)
     rkey = make_result_cache_key(start_dt, end_dt)
+    pkey = make_page_cache_key(rkey, page, per_page)
+
+    # Hot path: the requested page is already cached on its own
+    cached = await get_cached_rows(pkey)
+    if cached is not None and near_expiry(cached[2]):
+        # Let the full-range entry (and its refresh-ahead) serve this page
+        cached = None
+    if cached is None:
+        cached = await get_cached_window(rkey, page, per_page)
+        if cached is None:
+            rows, total_rows = await _scrape_coalesced(
+                session, rkey,
+                start_month, start_day, start_year,
+                end_month, end_day, end_year,
+            )
+            start_idx = (page - 1) * per_page
+            page_rows = rows[start_idx:start_idx + per_page]
+            expires_at = None
+        else:
+            page_rows, total_rows, expires_at = cached
+        # A page copied from the full-range entry expires with it, so a hot
+        # page picks up the refreshed range instead of lagging a cycle
+        ttl = RESULT_TTL if expires_at is None else ceil(expires_at - time.time())
+        if page_rows and ttl > 0:
+            try:
+                await cache_set(
+                    pkey, dump_rows_payload(page_rows, total_rows, expires_at), ex=ttl,
+                )
+            except Exception:
+                pass  # cache failure should not break the request
+    else:
+        page_rows, total_rows, expires_at = cached
+
+    # Refresh-ahead: hide the next miss behind this hit
+    if near_expiry(expires_at) and rkey not in _inflight:
+        _start_scrape(
+            session, rkey,
+            start_month, start_day, start_year,
+            end_month, end_day, end_year,
+        )
+
+    # Rehydrate without re-validation (rows were produced by us)
+    return [LottoResult.model_construct(**row) for row in page_rows], total_rows
+
+
+async def _scrape_coalesced(
+    session: requests.AsyncSession,
+    rkey: str,
+    start_month: str, start_day: int, start_year: int,
+    end_month: str, end_day: int, end_year: int,
+) -> Tuple[list[dict[str, str]], int]:
+    """Run (or join) the single in-flight scrape for ``rkey``."""
+    # Coalesce concurrent misses for the same key onto a single scrape.
+    # shield() keeps one cancelled caller from aborting the shared task.
+    task = _start_scrape(
+        session, rkey,
+        start_month, start_day, start_year,
+        end_month, end_day, end_year,
+    )
+    return await asyncio.shield(task)
+
+
+def _start_scrape(
+    session: requests.AsyncSession,
+    rkey: str,
+    start_month: str, start_day: int, start_year: int,
+    end_month: str, end_day: int, end_year: int,
+) -> asyncio.Task:
+    """Return the in-flight scrape task for ``rkey``, starting one if needed."""
+    task = _inflight.get(rkey)
+    if task is None:
+        task = asyncio.create_task(_scrape_and_cache_results(
+            session, rkey,
+            start_month, start_day, start_year,
+            end_month, end_day, end_year,
+        ))
+        _inflight[rkey] = task
+        task.add_done_callback(lambda t: _inflight_done(rkey, t))
+    return task
 
-    cached = await redis.get(rkey)
-    if cached:
-        try:
-            payload = json.loads(cached)
-            rows = payload.get("rows", [])
-            total_rows = payload.get("total_rows", len(rows))
-            # Rehydrate to Pydantic
-            results = [LottoResult(**row) for row in rows]
-            return results, total_rows
-        except Exception:
-            pass  # ignore cache error and proceed to scrape
 
-    async with requests.AsyncSession(impersonate="chrome136", verify=False, http_version="v2") as s:
-        event_fields = await get_event_fields_async(s)
+def _inflight_done(rkey: str, task: asyncio.Task) -> None:
+    """Drop a finished scrape from the in-flight map."""
+    if _inflight.get(rkey) is task:
+        _inflight.pop(rkey, None)
+    if not task.cancelled():
+        task.exception()  # mark retrieved even if every waiter went away
+
+
+def event_fields_rejected(r: requests.Response) -> bool:
+    """True if a search POST failed because the hidden fields were stale."""
+    if r.status_code >= 500:
+        return True
+    if r.status_code >= 400:
+        return False  # e.g. 403 geoblock: unrelated to the form fields
+    return any(marker in r.content for marker in STALE_FIELDS_MARKERS)
+
+
+async def _scrape_and_cache_results(
+    session: requests.AsyncSession,
+    rkey: str,
+    start_month: str, start_day: int, start_year: int,
+    end_month: str, end_day: int, end_year: int,
+) -> Tuple[list[dict[str, str]], int]:
+    """Perform GET (fields) + POST (results), parse the table and cache it.
+
+    Cached event fields are trusted until the POST shows they are stale (a
+    5xx or an ASP.NET viewstate/event-validation error page); then they are
+    evicted and the search is retried once with freshly fetched fields; a
+    second rejection raises RequestsError. A page without a results table is
+    an empty result, not a stale-fields signal.
+    """
+    for attempt in range(2):
+        event_fields = await get_event_fields_async(session)
 
         form = {
             **event_fields,
@@ -292,48 +544,73 @@ async def scrape_lotto_results_async(
         }
 
         async with OUTBOUND_SEMAPHORE:
-            r = await s.post(BASE_URL, headers=HEADERS, data=form)
-        r.raise_for_status()
+            r = await session.post(BASE_URL, headers=HEADERS, data=form)
+
+        if not event_fields_rejected(r):
+            break
+        if attempt:
+            # Rejected even with fresh fields: an upstream failure, not "no results"
+            r.raise_for_status()
+            raise requests.RequestsError("PCSO rejected the search form after a retry.")
+        # Stale hidden fields: evict and retry with a fresh GET
+        try:
+            await evict_event_fields(event_fields)
+        except Exception:
+            pass  # cache failure should not break the request
 
+    r.raise_for_status()
     tree = HTMLParser(r.text)
-    table = tree.css_first("table.search-lotto-result-table")
+    table = tree.css_first(RESULT_TABLE_SELECTOR)
     if not table:
         return [], 0
 
-    # Optional schema check (defensive)
+    # Optional schema check (defensive); headers live in the first row only
     header_tr = table.css_first("tr")
-    expected_headers = ["LOTTO GAME", "COMBINATIONS", "DRAW DATE", "JACKPOT (PHP)", "WINNERS"]
     if header_tr:
         headers = [th.text(strip=True) for th in header_tr.css("th")]
-        if headers != expected_headers:
+        if headers != EXPECTED_HEADERS:
+            # Site layout changed: anything cached from the old layout is suspect
+            try:
+                await invalidate_prefix(RESULTS_PATTERN)
+            except Exception:
+                pass  # cache failure should not mask the real error
             raise ValueError("Unexpected table structure from PCSO site.")
 
-    body_rows = table.css("tr")[1:]
-    total_rows = len(body_rows)
-
-    results: list[LottoResult] = []
-    for row in body_rows:
-        cols = [td.text(strip=True) for td in row.css("td")]
-        if cols and len(cols) == 5:
-            results.append(LottoResult(
-                game=cols[0],
-                combination=cols[1],
-                draw_date=cols[2],
-                jackpot_php=cols[3],
-                winners=cols[4],
-            ))
-
-    # Cache parsed results
+    # Single selector pass over all body cells, grouped by their parent row.
+    # Rows without exactly 5 cells (notes, colspan footers) are skipped.
+    # Plain dicts only; LottoResult objects are built later for the returned page
+    row_texts = (
+        [td.text(strip=True) for td in cells]
+        for _, cells in groupby(table.css("td"), key=lambda td: td.parent.mem_id)
+    )
+    rows: list[dict[str, str]] = [
+        dict(zip(RESULT_FIELDS, cols)) for cols in row_texts if len(cols) == 5
+    ]
+    total_rows = len(rows)
+
+    # Cache parsed results (raw row dicts; no per-row model_dump). Rows go to
+    # one list for LRANGE paging, written before the metadata entries that
+    # readers check first; the list is also the last good copy, so it is
+    # kept for LAST_GOOD_TTL and written once per scrape.
     try:
-        to_store = {
-            "rows": [r.model_dump() for r in results],
-            "total_rows": total_rows,
-        }
-        await redis.set(rkey, json.dumps(to_store), ex=RESULT_TTL)
+        await list_set(
+            make_rows_list_key(rkey),
+            [orjson.dumps(row).decode() for row in rows],
+            ex=LAST_GOOD_TTL,
+        )
+        await asyncio.gather(
+            cache_set(rkey, dump_rows_payload(None, total_rows), ex=RESULT_TTL),
+            # L2 only: see get_stale_results
+            redis.set(
+                make_last_good_cache_key(rkey),
+                dump_rows_payload(None, total_rows),
+                ex=LAST_GOOD_TTL,
+            ),
+        )
     except Exception:
         pass  # cache failure should not break the request
 
-    return results, total_rows
+    return rows, total_rows
 
 
 # --------------------
@@ -349,6 +626,8 @@ async def root():
     responses={400: {"model": ErrorResponse}, 404: {"model": ErrorResponse}, 500: {"model": ErrorResponse}},
 )
 async def get_lotto_results(
+    request: Request,
+    response: Response,
     start_month: Optional[str] = Query(None, examples="September"),
     start_day: Optional[int] = Query(None, ge=1, le=31, examples=2),
     start_year: Optional[int] = Query(None, ge=1900, le=2100, examples=2025),
@@ -363,6 +642,8 @@ async def get_lotto_results(
     Query params are optional; sensible defaults cover full available window.
     Pagination enforced (max 50 / page) to keep responses lean.
     404 if no rows found; 400 for bad input; 502 for upstream network errors.
+    On upstream or parse errors the last good copy (if any) is served instead,
+    flagged with ``X-Cache: STALE``.
     """
     # Validate and resolve dates with defaults
     (
@@ -377,28 +658,30 @@ async def get_lotto_results(
     start_time = time.perf_counter()
 
     try:
-        all_results, total_rows = await scrape_lotto_results_async(
+        paginated, total_rows = await scrape_lotto_results_async(
+            request.app.state.session,
             start_month, start_day, start_year,
             end_month, end_day, end_year,
+            page, per_page,
         )
-    except requests.RequestsError as re:
-        raise HTTPException(status_code=502, detail=f"Network error contacting PCSO: {re}")
-    except ValueError as ve:
-        raise HTTPException(status_code=500, detail=str(ve))
+    except (requests.RequestsError, ValueError) as err:
+        stale = await get_stale_results(make_result_cache_key(start_dt, end_dt), page, per_page)
+        if stale is None:
+            if isinstance(err, requests.RequestsError):
+                raise HTTPException(status_code=502, detail=f"Network error contacting PCSO: {err}")
+            raise HTTPException(status_code=500, detail=str(err))
+        paginated, total_rows = stale
+        response.headers["X-Cache"] = "STALE"
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Unexpected error: {e}")
 
-    if total_rows == 0 or not all_results:
+    if total_rows == 0:
         raise HTTPException(status_code=404, detail="No results found for the given parameters.")
 
     total_pages = max(ceil(total_rows / per_page), 1)
     if page > total_pages:
         raise HTTPException(status_code=400, detail="Page number exceeds total pages.")
 
-    start_idx = (page - 1) * per_page
-    end_idx = min(start_idx + per_page, total_rows)
-    paginated = all_results[start_idx:end_idx]
-
     elapsed = time.perf_counter() - start_time
 
     return SuccessResponse(